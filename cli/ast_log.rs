@@ -29,7 +29,7 @@ fn format_project(project: &Project, project_path: &Path) -> String {
     let _ = writeln!(out, "  files: [");
 
     let rel_prefix = project_path.to_string_lossy().into_owned();
-    for (rel_path, file) in &project.files {
+    for (rel_path, file) in project.files() {
         let _ = writeln!(out, "    HrFile {{");
         let full = project_path.join(rel_path);
         let display = full
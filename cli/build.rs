@@ -8,7 +8,7 @@ pub fn build_site(project_path: &Path, log_ast: bool) -> Result<(), String> {
     let mut project = load_project(project_path)?;
 
     if log_ast {
-        ast_log::write_ast_log(project_path, &project.config)?;
+        ast_log::write_ast_log(project_path, project.config())?;
     }
 
     let dist_path = project_path.join("dist");
@@ -76,8 +76,8 @@ pub fn build_site(project_path: &Path, log_ast: bool) -> Result<(), String> {
         }
     }
 
-    let static_src = project_path.join(&project.config.static_path);
-    let static_dst = dist_path.join(&project.config.static_path);
+    let static_src = project_path.join(&project.config().static_path);
+    let static_dst = dist_path.join(&project.config().static_path);
     copy_dir_recursive(&static_src, &static_dst)?;
 
     println!("Done! {} pages rendered to dist/", rendered_count);
@@ -38,14 +38,14 @@ pub async fn run_dev(project_path: &Path, log_ast: bool, debug: bool) -> Result<
     let mut project = load_project(project_path)?;
 
     if log_ast {
-        ast_log::write_ast_log(project_path, &project.config)?;
+        ast_log::write_ast_log(project_path, project.config())?;
     }
 
-    let host = project.config.host.clone();
-    let port = project.config.port;
-    let static_path_str = project.config.static_path.clone();
+    let host = project.config().host.clone();
+    let port = project.config().port;
+    let static_path_str = project.config().static_path.clone();
     let static_path_arc = Arc::new(project_path.join(&static_path_str));
-    let backend_runtime = Arc::new(build_backend_runtime(project_path, &project.config));
+    let backend_runtime = Arc::new(build_backend_runtime(project_path, project.config()));
 
     project.parse_all().map_err(|e| e.to_string())?;
 
@@ -96,7 +96,7 @@ pub async fn serve_static(project_path: &Path, log_ast: bool) -> Result<(), Stri
     let project = load_project(project_path)?;
 
     if log_ast {
-        ast_log::write_ast_log(project_path, &project.config)?;
+        ast_log::write_ast_log(project_path, project.config())?;
     }
 
     let dist_path = project_path.join("dist");
@@ -110,12 +110,13 @@ pub async fn serve_static(project_path: &Path, log_ast: bool) -> Result<(), Stri
 
     println!(
         "Serving static files from 'dist/' on http://{}:{}",
-        project.config.host, project.config.port
+        project.config().host,
+        project.config().port
     );
 
     let app = Router::new().fallback_service(ServeDir::new(dist_path));
 
-    let addr: SocketAddr = format!("{}:{}", project.config.host, project.config.port)
+    let addr: SocketAddr = format!("{}:{}", project.config().host, project.config().port)
         .parse()
         .map_err(|e| format!("Invalid address: {}", e))?;
 
@@ -150,30 +151,43 @@ async fn watch_for_changes(project_path: PathBuf, state: AppState) {
 
     println!("   Watching for changes...");
 
-    let mut last_reload = tokio::time::Instant::now();
-    const DEBOUNCE_MS: u64 = 500;
+    // A save or a checkout touches many files at once; the burst is folded
+    // into one reload. The window closes after SETTLE_MS without a relevant
+    // event, or MAX_WAIT_MS after the first one, whichever comes first - so
+    // unrelated churn in the tree (logs, build output, `.git`) can neither
+    // extend it nor postpone the reload indefinitely.
+    const SETTLE_MS: u64 = 150;
+    const MAX_WAIT_MS: u64 = 1000;
 
     while let Some(res) = rx.recv().await {
         match res {
-            Ok(event) => {
-                if !is_relevant_change(&event) {
-                    continue;
-                }
-
-                let now = tokio::time::Instant::now();
-                if now.duration_since(last_reload) < Duration::from_millis(DEBOUNCE_MS) {
-                    continue;
-                }
-                last_reload = now;
+            Ok(event) if is_relevant_change(&event) => {}
+            Ok(_) => continue,
+            Err(e) => {
+                eprintln!("   Watch error: {}\n", e);
+                continue;
+            }
+        }
 
-                println!("\n   Change detected, reloading...");
-                match reload_project(&project_path, &state) {
-                    Ok(true) => println!("   ✓ Reloaded\n"),
-                    Ok(false) => println!("   ✓ Reloaded (config may have changed)\n"),
-                    Err(e) => eprintln!("   ✗ Reload error: {}\n", e),
+        // Reload on the trailing edge, so the last write of a burst is
+        // always picked up rather than dropped inside a debounce window.
+        let deadline = tokio::time::Instant::now() + Duration::from_millis(MAX_WAIT_MS);
+        let mut settle = tokio::time::Instant::now() + Duration::from_millis(SETTLE_MS);
+        while let Ok(Some(res)) = tokio::time::timeout_at(settle.min(deadline), rx.recv()).await {
+            match res {
+                Ok(event) if is_relevant_change(&event) => {
+                    settle = tokio::time::Instant::now() + Duration::from_millis(SETTLE_MS);
                 }
+                Ok(_) => {}
+                Err(e) => eprintln!("   Watch error: {}\n", e),
             }
-            Err(e) => eprintln!("   Watch error: {}\n", e),
+        }
+
+        println!("\n   Change detected, reloading...");
+        match reload_project(&project_path, &state) {
+            Ok(true) => println!("   ✓ Reloaded\n"),
+            Ok(false) => println!("   ✓ Reloaded (config may have changed)\n"),
+            Err(e) => eprintln!("   ✗ Reload error: {}\n", e),
         }
     }
 }
@@ -214,9 +228,9 @@ fn reload_project(project_path: &Path, state: &AppState) -> Result<bool, String>
     new_project.parse_all().map_err(|e| e.to_string())?;
 
     let mut project = state.project.write().unwrap();
-    let config_changed = project.config.site_name != new_project.config.site_name
-        || project.config.host != new_project.config.host
-        || project.config.port != new_project.config.port;
+    let config_changed = project.config().site_name != new_project.config().site_name
+        || project.config().host != new_project.config().host
+        || project.config().port != new_project.config().port;
     *project = new_project;
 
     Ok(config_changed)
@@ -386,17 +400,7 @@ async fn api_get_handler(
         .backend_runtime
         .call_endpoint(&format!("/api/{}", path), &serde_json::json!({}))
     {
-        Ok(result) => {
-            if let Some(html) = result.as_str() {
-                Html(html.to_string()).into_response()
-            } else {
-                (
-                    StatusCode::OK,
-                    serde_json::to_string(&result).unwrap_or_default(),
-                )
-                    .into_response()
-            }
-        }
+        Ok(result) => endpoint_response(result),
         Err(e) => {
             eprintln!("[ERROR] API GET /api/{} failed: {}", path, e);
             (
@@ -444,17 +448,7 @@ async fn endpoint_handler(
     let full_path = format!("/api/{}", path);
 
     match state.backend_runtime.call_endpoint(&full_path, &form_data) {
-        Ok(result) => {
-            if let Some(html) = result.as_str() {
-                Html(html.to_string()).into_response()
-            } else {
-                (
-                    StatusCode::OK,
-                    serde_json::to_string(&result).unwrap_or_default(),
-                )
-                    .into_response()
-            }
-        }
+        Ok(result) => endpoint_response(result),
         Err(e) => {
             eprintln!("[ERROR] POST /{} - endpoint error: {}", path, e);
             (
@@ -466,6 +460,20 @@ async fn endpoint_handler(
     }
 }
 
+/// Answer with an endpoint's result: a string is HTML, anything else JSON.
+/// The string is moved into the body, not copied, so a large fragment is held
+/// once rather than twice while the response is built.
+fn endpoint_response(result: serde_json::Value) -> Response {
+    match result {
+        serde_json::Value::String(html) => Html(html).into_response(),
+        other => (
+            StatusCode::OK,
+            serde_json::to_string(&other).unwrap_or_default(),
+        )
+            .into_response(),
+    }
+}
+
 async fn hrml_js_handler() -> Response {
     (
         StatusCode::OK,
@@ -5,12 +5,16 @@ use std::path::{Path, PathBuf};
 
 pub struct Runtime {
     endpoints_path: PathBuf,
+    /// Built once per runtime rather than per call: every endpoint renders
+    /// against the same base path, so there is nothing to re-derive.
+    engine: Engine,
 }
 
 impl Runtime {
     pub fn new(endpoints_path: &str) -> Self {
         Self {
             endpoints_path: PathBuf::from(endpoints_path),
+            engine: Engine::new(endpoints_path),
         }
     }
 
@@ -32,61 +36,76 @@ impl Runtime {
             ("", "")
         };
 
-        let context = json!({
-            "id": id,
-            "action": action,
-            "data": data,
-        });
-
-        if let Some(path) = self.find_template_path(module, action) {
-            let base = self.endpoints_path.to_string_lossy().to_string();
-            let rel = path
-                .strip_prefix(&self.endpoints_path)
-                .map_err(|e| e.to_string())?;
-            let rel = rel.to_string_lossy().replace('\\', "/");
-            let rendered = Engine::new(&base)
-                .render_fragment(&rel, &context)
-                .map_err(|e| e.to_string())?;
-            return Ok(Value::String(rendered));
-        }
-
-        if let Some(path) = self.find_text_path(module, action) {
-            let content = fs::read_to_string(&path)
-                .map_err(|e| format!("Failed to read endpoint file {}: {}", path.display(), e))?;
-            return Ok(Value::String(content));
-        }
+        let Some((file, reply)) = self.find_endpoint(module, action) else {
+            return Err(format!("Endpoint not found for path: {}", path));
+        };
 
-        if let Some(path) = self.find_json_path(module, action) {
-            let content = fs::read_to_string(&path)
-                .map_err(|e| format!("Failed to read endpoint file {}: {}", path.display(), e))?;
-            let value: Value = serde_json::from_str(&content)
-                .map_err(|e| format!("Invalid endpoint JSON in {}: {}", path.display(), e))?;
-            return Ok(value);
+        match reply {
+            Reply::Template => {
+                let context = json!({
+                    "id": id,
+                    "action": action,
+                    "data": data,
+                });
+                let rel = file
+                    .strip_prefix(&self.endpoints_path)
+                    .map_err(|e| e.to_string())?;
+                let rel = rel.to_string_lossy().replace('\\', "/");
+                let rendered = self
+                    .engine
+                    .render_fragment(&rel, &context)
+                    .map_err(|e| e.to_string())?;
+                Ok(Value::String(rendered))
+            }
+            Reply::Text => {
+                let content = fs::read_to_string(&file).map_err(|e| {
+                    format!("Failed to read endpoint file {}: {}", file.display(), e)
+                })?;
+                Ok(Value::String(content))
+            }
+            Reply::Json => {
+                let content = fs::read_to_string(&file).map_err(|e| {
+                    format!("Failed to read endpoint file {}: {}", file.display(), e)
+                })?;
+                serde_json::from_str(&content)
+                    .map_err(|e| format!("Invalid endpoint JSON in {}: {}", file.display(), e))
+            }
         }
-
-        Err(format!("Endpoint not found for path: {}", path))
     }
 
-    fn find_template_path(&self, module: &str, action: &str) -> Option<PathBuf> {
-        self.find_path(module, action, "hrml")
-    }
-
-    fn find_text_path(&self, module: &str, action: &str) -> Option<PathBuf> {
-        self.find_path(module, action, "html")
-            .or_else(|| self.find_path(module, action, "txt"))
-    }
-
-    fn find_json_path(&self, module: &str, action: &str) -> Option<PathBuf> {
-        self.find_path(module, action, "json")
-    }
-
-    fn find_path(&self, module: &str, action: &str, ext: &str) -> Option<PathBuf> {
+    /// The first existing endpoint file for `module`/`action`, walking
+    /// [`REPLIES`] in order, together with how to answer it.
+    fn find_endpoint(&self, module: &str, action: &str) -> Option<(PathBuf, Reply)> {
         let api_root = self.endpoints_path.join("api");
-        let candidates = endpoint_candidates(&api_root, module, action, ext);
-        candidates.into_iter().find(|candidate| candidate.exists())
+        REPLIES.iter().find_map(|&(ext, reply)| {
+            endpoint_candidates(&api_root, module, action, ext)
+                .into_iter()
+                .find(|candidate| candidate.exists())
+                .map(|path| (path, reply))
+        })
     }
 }
 
+/// How an endpoint file is answered.
+#[derive(Clone, Copy)]
+enum Reply {
+    /// Rendered as an HRML fragment against `{ id, action, data }`.
+    Template,
+    /// Returned verbatim as a string.
+    Text,
+    /// Parsed and returned as a JSON value.
+    Json,
+}
+
+/// Extension → reply, in lookup precedence: a template shadows static text,
+/// which shadows JSON. One table replaces a `find_*_path` method per kind.
+const REPLIES: &[(&str, Reply)] = &[
+    ("hrml", Reply::Template),
+    ("html", Reply::Text),
+    ("txt", Reply::Text),
+    ("json", Reply::Json),
+];
+
 fn endpoint_candidates(api_root: &Path, module: &str, action: &str, ext: &str) -> Vec<PathBuf> {
     let mut out = Vec::new();
 
@@ -80,8 +80,9 @@
 //! deterministic functions Context → Html.)
 
 use serde_json::{Map, Value};
+use std::collections::BTreeMap;
 use std::fs;
-use std::path::Path;
+use std::path::{Path, PathBuf};
 
 /// Load a single data file into a [`Value`] by dispatching on extension.
 ///
@@ -111,13 +112,10 @@ pub fn load_data_file(path: &Path) -> Result<Value, String> {
         "json" => serde_json::from_str(&content)
             .map_err(|e| format!("Invalid JSON in {}: {}", path.display(), e)),
 
-        "toml" => content
-            .parse::<toml::Value>()
-            .map_err(|e| format!("Invalid TOML in {}: {}", path.display(), e))
-            .and_then(|v| {
-                serde_json::to_value(v)
-                    .map_err(|e| format!("TOML conversion error in {}: {}", path.display(), e))
-            }),
+        // Deserialize straight into the JSON value model: one pass, with no
+        // intermediate `toml::Value` tree to build and then re-serialize.
+        "toml" => toml::from_str(&content)
+            .map_err(|e| format!("Invalid TOML in {}: {}", path.display(), e)),
 
         "md" | "mdx" => {
             let (meta, body) = crate::features::render_mdx_with_math(&content);
@@ -148,7 +146,7 @@ pub fn load_data_file(path: &Path) -> Result<Value, String> {
 /// ```
 ///
 /// Files starting with `.` or `_` are excluded.  Only one extension per stem
-/// is loaded, preferring `mdx` > `md` > `json` > `toml`.
+/// is loaded, preferring `mdx` > `md` > `json` > `toml` (see [`scan_stems`]).
 ///
 /// This is a *co-inductive fold* over the filesystem: for each slug we
 /// construct a record whose fields are the parsed frontmatter/JSON/TOML
@@ -159,59 +157,80 @@ pub fn load_data_file(path: &Path) -> Result<Value, String> {
 /// The fold pattern follows **Meijer, Fokkinga, Paterson** (1991).
 /// "Functional Programming with Bananas, Lenses, Envelopes and Barbed Wire".
 pub fn load_data_dir(dir_path: &Path) -> Result<Value, String> {
+    let mut items = Vec::new();
+    for (slug, file_path) in scan_stems(dir_path, &["mdx", "md", "json", "toml"])? {
+        match load_data_file(&file_path) {
+            Ok(value) => {
+                let mut obj = match value {
+                    Value::Object(m) => m,
+                    other => {
+                        let mut m = Map::new();
+                        m.insert("value".to_string(), other);
+                        m
+                    }
+                };
+                obj.insert("slug".to_string(), Value::String(slug));
+                items.push(Value::Object(obj));
+            }
+            Err(e) => {
+                eprintln!("[WARNING] Skipping {}: {}", file_path.display(), e);
+            }
+        }
+    }
+
+    Ok(Value::Array(items))
+}
+
+/// One `read_dir` pass over `dir_path`, yielding `(stem, path)` for every
+/// visible file whose extension is in `exts`, sorted by stem.
+///
+/// A stem present under several extensions appears once, with the extension
+/// listed earliest in `exts` - so `exts` doubles as the preference order.
+/// Choosing here, from the listing already in hand, replaces a per-stem
+/// `exists()` probe for each candidate extension. Entry types come from the
+/// listing too, so only symlinks (followed, as before) cost a `stat` - the
+/// directory is otherwise read once, however many records it holds.
+pub(crate) fn scan_stems(dir_path: &Path, exts: &[&str]) -> Result<Vec<(String, PathBuf)>, String> {
     let entries = fs::read_dir(dir_path)
         .map_err(|e| format!("Failed to read directory {}: {}", dir_path.display(), e))?;
 
-    let mut filenames: Vec<String> = Vec::new();
+    let mut best: BTreeMap<String, (usize, PathBuf)> = BTreeMap::new();
     for entry in entries {
         let entry =
             entry.map_err(|e| format!("Failed to read entry in {}: {}", dir_path.display(), e))?;
         let path = entry.path();
-        if !path.is_file() {
+        let is_file = match entry.file_type() {
+            Ok(kind) if kind.is_symlink() => path.is_file(),
+            Ok(kind) => kind.is_file(),
+            Err(_) => false,
+        };
+        if !is_file {
             continue;
         }
         let file_name = path.file_name().and_then(|n| n.to_str()).unwrap_or("");
         if file_name.starts_with('.') || file_name.starts_with('_') {
             continue;
         }
-        if let Some(ext) = path.extension() {
-            if matches!(ext.to_str(), Some("json" | "toml" | "md" | "mdx")) {
-                if let Some(stem) = path.file_stem().and_then(|s| s.to_str()) {
-                    filenames.push(stem.to_string());
-                }
-            }
-        }
-    }
-    filenames.sort();
-
-    let mut items = Vec::new();
-    let exts = ["mdx", "md", "json", "toml"];
-
-    for slug in &filenames {
-        for ext in &exts {
-            let file_path = dir_path.join(format!("{}.{}", slug, ext));
-            if file_path.exists() {
-                match load_data_file(&file_path) {
-                    Ok(value) => {
-                        let mut obj = match value {
-                            Value::Object(m) => m,
-                            other => {
-                                let mut m = Map::new();
-                                m.insert("value".to_string(), other);
-                                m
-                            }
-                        };
-                        obj.insert("slug".to_string(), Value::String(slug.clone()));
-                        items.push(Value::Object(obj));
-                    }
-                    Err(e) => {
-                        eprintln!("[WARNING] Skipping {}: {}", file_path.display(), e);
-                    }
-                }
-                break;
+        let Some(rank) = path
+            .extension()
+            .and_then(|e| e.to_str())
+            .and_then(|ext| exts.iter().position(|x| *x == ext))
+        else {
+            continue;
+        };
+        let Some(stem) = path.file_stem().and_then(|s| s.to_str()) else {
+            continue;
+        };
+        match best.get(stem) {
+            Some((held, _)) if *held <= rank => {}
+            _ => {
+                best.insert(stem.to_string(), (rank, path));
             }
         }
     }
 
-    Ok(Value::Array(items))
+    Ok(best
+        .into_iter()
+        .map(|(stem, (_, path))| (stem, path))
+        .collect())
 }
@@ -1,9 +1,4 @@
-fn escape_attr(input: &str) -> String {
-    input
-        .replace('&', "&amp;")
-        .replace('"', "&quot;")
-        .replace('\'', "&#39;")
-}
+use crate::oxml::escape_attr;
 
 fn unescape_html(text: &str) -> String {
     text.replace("&amp;", "&")
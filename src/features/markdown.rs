@@ -1,3 +1,4 @@
+use crate::oxml::escape_attr;
 use pulldown_cmark::{html::push_html, Options, Parser as MdParser};
 use serde_json::{Map, Number, Value};
 
@@ -20,13 +21,6 @@ pub fn render_markdown_with_frontmatter(source: &str) -> (Value, String) {
     (meta, render_markdown(body))
 }
 
-fn escape_attr(input: &str) -> String {
-    input
-        .replace('&', "&amp;")
-        .replace('"', "&quot;")
-        .replace('\'', "&#39;")
-}
-
 fn unescape_html(text: &str) -> String {
     text.replace("&amp;", "&")
         .replace("&lt;", "<")
@@ -142,8 +136,8 @@ fn parse_frontmatter(frontmatter: &str) -> Value {
         return Value::Null;
     }
 
-    match frontmatter.parse::<toml::Value>() {
-        Ok(v) => serde_json::to_value(v).unwrap_or(Value::Null),
+    match toml::from_str(frontmatter) {
+        Ok(v) => v,
         Err(_) => parse_yamlish_frontmatter(frontmatter),
     }
 }
@@ -2,20 +2,37 @@ use std::collections::BTreeMap;
 
 /// Write attributes in key order. `BTreeMap` iterates sorted, so output is a
 /// deterministic function of the attribute set.
+///
+/// Values are resolved from data, so a `"` inside one would close the
+/// attribute and let the rest of the value through as markup. It is written
+/// as `&quot;` during the copy - one pass over the value. Other characters
+/// are left alone: a value already holding an entity (`&amp;`) came from the
+/// template source and must not be escaped a second time.
 fn write_attrs(tag: &mut String, attrs: &BTreeMap<String, String>) {
     for (k, v) in attrs {
         tag.push(' ');
         tag.push_str(k);
         tag.push_str("=\"");
-        tag.push_str(v);
+        crate::oxml::escape_with(tag, v, |b| (b == b'"').then_some("&quot;"));
         tag.push('"');
     }
 }
 
-pub fn element(name: &str, attrs: &BTreeMap<String, String>, body: &str) -> String {
-    let mut tag = String::from("<");
+/// `<name` and its attributes, in a buffer already sized for the `tail`
+/// bytes the caller will append - so a tag is allocated once rather than
+/// regrown push by push. The estimate is exact unless a value needs escaping.
+fn open_tag(name: &str, attrs: &BTreeMap<String, String>, tail: usize) -> String {
+    let attrs_len: usize = attrs.iter().map(|(k, v)| k.len() + v.len() + 4).sum();
+    let mut tag = String::with_capacity(1 + name.len() + attrs_len + tail);
+    tag.push('<');
     tag.push_str(name);
     write_attrs(&mut tag, attrs);
+    tag
+}
+
+pub fn element(name: &str, attrs: &BTreeMap<String, String>, body: &str) -> String {
+    // `>` body `</name>`
+    let mut tag = open_tag(name, attrs, 1 + body.len() + 2 + name.len() + 1);
     tag.push('>');
     tag.push_str(body);
     tag.push_str("</");
@@ -25,17 +42,13 @@ pub fn element(name: &str, attrs: &BTreeMap<String, String>, body: &str) -> Stri
 }
 
 pub fn void(name: &str, attrs: &BTreeMap<String, String>) -> String {
-    let mut tag = String::from("<");
-    tag.push_str(name);
-    write_attrs(&mut tag, attrs);
+    let mut tag = open_tag(name, attrs, 1);
     tag.push('>');
     tag
 }
 
 pub fn self_closed(name: &str, attrs: &BTreeMap<String, String>) -> String {
-    let mut tag = String::from("<");
-    tag.push_str(name);
-    write_attrs(&mut tag, attrs);
+    let mut tag = open_tag(name, attrs, 3);
     tag.push_str(" />");
     tag
 }
@@ -398,17 +398,26 @@ impl ONode {
 
     /// Render to an HTML string.
     pub fn render(&self) -> String {
+        let mut out = String::new();
+        self.render_into(&mut out);
+        out
+    }
+
+    /// Render by appending to `out`. The whole tree streams into one buffer,
+    /// so a render costs the final string's growth and nothing per node - no
+    /// intermediate strings for children, no joins.
+    pub fn render_into(&self, out: &mut String) {
         match self {
-            ONode::Empty => String::new(),
-            ONode::Text(t) => escape_html(t),
-            ONode::Raw(r) => r.clone(),
-            ONode::Content(c) => c.render(),
-            ONode::Void(v) => v.render(),
-            ONode::Cat(nodes) => nodes
-                .iter()
-                .map(|n| n.render())
-                .collect::<Vec<_>>()
-                .join(""),
+            ONode::Empty => {}
+            ONode::Text(t) => escape_html_into(out, t),
+            ONode::Raw(r) => out.push_str(r),
+            ONode::Content(c) => c.render_into(out),
+            ONode::Void(v) => v.render_into(out),
+            ONode::Cat(nodes) => {
+                for node in nodes {
+                    node.render_into(out);
+                }
+            }
         }
     }
 
@@ -467,17 +476,22 @@ fn flatten_vec(nodes: Vec<ONode>) -> Vec<ONode> {
 
 impl OContent {
     pub fn render(&self) -> String {
-        let attrs = render_attrs(&self.attrs);
-        let children = self
-            .children
-            .iter()
-            .map(|n| n.render())
-            .collect::<Vec<_>>()
-            .join("");
-        format!(
-            "<{}{}>{}</{}>",
-            self.tag.name, attrs, children, self.tag.name
-        )
+        let mut out = String::new();
+        self.render_into(&mut out);
+        out
+    }
+
+    pub fn render_into(&self, out: &mut String) {
+        out.push('<');
+        out.push_str(self.tag.name);
+        write_attrs(out, &self.attrs);
+        out.push('>');
+        for child in &self.children {
+            child.render_into(out);
+        }
+        out.push_str("</");
+        out.push_str(self.tag.name);
+        out.push('>');
     }
 
     fn render_indent(&self, depth: usize) -> String {
@@ -501,32 +515,85 @@ impl OContent {
 
 impl OVoid {
     pub fn render(&self) -> String {
-        let attrs = render_attrs(&self.attrs);
-        format!("<{}{}>", self.tag.name, attrs)
+        let mut out = String::new();
+        self.render_into(&mut out);
+        out
+    }
+
+    pub fn render_into(&self, out: &mut String) {
+        out.push('<');
+        out.push_str(self.tag.name);
+        write_attrs(out, &self.attrs);
+        out.push('>');
     }
 }
 
 fn render_attrs(attrs: &BTreeMap<String, String>) -> String {
-    attrs
-        .iter()
-        .map(|(k, v)| format!(" {}=\"{}\"", k, escape_attr(v)))
-        .collect::<String>()
+    let mut out = String::new();
+    write_attrs(&mut out, attrs);
+    out
+}
+
+fn write_attrs(out: &mut String, attrs: &BTreeMap<String, String>) {
+    for (k, v) in attrs {
+        out.push(' ');
+        out.push_str(k);
+        out.push_str("=\"");
+        escape_attr_into(out, v);
+        out.push('"');
+    }
 }
 
 pub fn escape_html(input: &str) -> String {
-    input
-        .replace('&', "&amp;")
-        .replace('<', "&lt;")
-        .replace('>', "&gt;")
-        .replace('"', "&quot;")
-        .replace('\'', "&#39;")
+    let mut out = String::with_capacity(input.len());
+    escape_html_into(&mut out, input);
+    out
 }
 
 pub fn escape_attr(input: &str) -> String {
-    input
-        .replace('&', "&amp;")
-        .replace('"', "&quot;")
-        .replace('\'', "&#39;")
+    let mut out = String::with_capacity(input.len());
+    escape_attr_into(&mut out, input);
+    out
+}
+
+fn escape_html_into(out: &mut String, input: &str) {
+    escape_with(out, input, |b| match b {
+        b'&' => Some("&amp;"),
+        b'<' => Some("&lt;"),
+        b'>' => Some("&gt;"),
+        b'"' => Some("&quot;"),
+        b'\'' => Some("&#39;"),
+        _ => None,
+    })
+}
+
+fn escape_attr_into(out: &mut String, input: &str) {
+    escape_with(out, input, |b| match b {
+        b'&' => Some("&amp;"),
+        b'"' => Some("&quot;"),
+        b'\'' => Some("&#39;"),
+        _ => None,
+    })
+}
+
+/// Single-pass escape onto `out`: runs of clean bytes are copied whole, each
+/// special byte is replaced by its entity. Every special byte is ASCII, so it
+/// can never sit inside a multi-byte UTF-8 sequence and the slice boundaries
+/// are always valid.
+pub(crate) fn escape_with(
+    out: &mut String,
+    input: &str,
+    entity: impl Fn(u8) -> Option<&'static str>,
+) {
+    let mut clean = 0;
+    for (i, b) in input.bytes().enumerate() {
+        if let Some(ent) = entity(b) {
+            out.push_str(&input[clean..i]);
+            out.push_str(ent);
+            clean = i + 1;
+        }
+    }
+    out.push_str(&input[clean..]);
 }
 
 // --- Typed convenience constructors ---
@@ -565,15 +632,16 @@ pub fn list(items: Vec<String>) -> String {
 
 /// Build a full HTML document from head and body nodes.
 pub fn doc(head: ONode, body: ONode) -> String {
-    let html = ONode::content(tags::HTML)
+    let mut out = String::from("<!DOCTYPE html>");
+    ONode::content(tags::HTML)
         .attr("lang", "en")
         .children(vec![
             ONode::content(tags::HEAD).child(head).build(),
             ONode::content(tags::BODY).child(body).build(),
         ])
         .build()
-        .render();
-    format!("<!DOCTYPE html>{}", html)
+        .render_into(&mut out);
+    out
 }
 
 // --- Common element shorthands ---
@@ -5,6 +5,7 @@ use crate::template::{
 };
 use serde_json::Value;
 use std::collections::BTreeMap;
+use std::sync::{Arc, Mutex, OnceLock};
 
 #[derive(Clone)]
 pub struct HrFile {
@@ -31,12 +32,17 @@ impl HrFile {
     }
 }
 
+/// An in-memory set of template files, resolved and rendered without I/O.
+///
+/// `config` and `files` are private: resolved pages are cached as a function
+/// of both, and every mutation goes through a method that invalidates it.
 #[derive(Clone)]
 pub struct Project {
-    pub config: Config,
-    pub files: BTreeMap<String, HrFile>,
+    config: Config,
+    files: BTreeMap<String, HrFile>,
     pub dependency_order: Vec<String>,
     engine: Engine,
+    resolved: ResolvedCache,
 }
 
 impl Project {
@@ -46,6 +52,7 @@ impl Project {
             files: BTreeMap::new(),
             engine: Engine::with_config(&config),
             dependency_order: Vec::new(),
+            resolved: ResolvedCache::default(),
         }
     }
 
@@ -62,7 +69,16 @@ impl Project {
         self
     }
 
+    pub fn config(&self) -> &Config {
+        &self.config
+    }
+
+    pub fn files(&self) -> &BTreeMap<String, HrFile> {
+        &self.files
+    }
+
     pub fn add_file(&mut self, path: String, text: String) {
+        self.resolved.clear();
         self.files.insert(path.clone(), HrFile::new(path, text));
     }
 
@@ -71,10 +87,12 @@ impl Project {
     }
 
     pub fn get_file_mut(&mut self, path: &str) -> Option<&mut HrFile> {
+        self.resolved.clear();
         self.files.get_mut(path)
     }
 
     pub fn update_file(&mut self, path: &str, text: String) -> TemplateResult<()> {
+        self.resolved.clear();
         let file = self.files.get_mut(path).ok_or_else(|| {
             TemplateError::code(
                 TemplateErrorPhase::Resolve,
@@ -88,6 +106,7 @@ impl Project {
     }
 
     pub fn parse_all(&mut self) -> TemplateResult<()> {
+        self.resolved.clear();
         for file in self.files.values_mut() {
             file.parse()?;
         }
@@ -163,7 +182,14 @@ impl Project {
     }
 
     /// Fully resolve a file's `<?load?>`s against the in-memory file map (no I/O).
-    fn resolve(&self, path: &str) -> TemplateResult<Vec<Node>> {
+    /// The result is a function of the file map alone, so it is kept until the
+    /// next edit and shared by every render of the page in between.
+    fn resolve(&self, path: &str) -> TemplateResult<Arc<Vec<Node>>> {
+        self.resolved
+            .get_or_insert(path, || self.resolve_uncached(path))
+    }
+
+    fn resolve_uncached(&self, path: &str) -> TemplateResult<Vec<Node>> {
         let tree = self
             .files
             .get(path)
@@ -176,11 +202,11 @@ impl Project {
                 .with_template_path(path)
             })?;
 
-        let fetch = |file: &str| -> TemplateResult<Vec<Node>> {
+        let fetch = |file: &str| -> TemplateResult<Arc<Vec<Node>>> {
             self.files
                 .get(file)
                 .and_then(|f| f.tree.as_ref())
-                .map(|t| t.nodes.clone())
+                .map(|t| Arc::new(t.nodes.clone()))
                 .ok_or_else(|| {
                     TemplateError::code(
                         TemplateErrorPhase::Resolve,
@@ -233,7 +259,7 @@ impl Project {
         let nodes = self.resolve(path)?;
         let result = self.engine.render_nodes_from_tree(&nodes, data)?;
 
-        if std::env::var("HRML_DEBUG").is_ok() {
+        if debug_enabled() {
             let html = result.render();
             eprintln!(
                 "[DEBUG] render({:?}) → {} nodes → {} bytes",
@@ -280,6 +306,50 @@ impl Project {
     }
 }
 
+/// Whether `HRML_DEBUG` is set. Read once per process rather than on every
+/// render: the dev server sets it before the first page is served and nothing
+/// changes it afterwards.
+fn debug_enabled() -> bool {
+    static DEBUG: OnceLock<bool> = OnceLock::new();
+    *DEBUG.get_or_init(|| std::env::var("HRML_DEBUG").is_ok())
+}
+
+/// Resolved page trees by path. Any file can reach any page - through a
+/// `<?load?>`, the default layout or the component library - so every
+/// mutation of the file map clears the whole table rather than chasing
+/// dependents. A cloned [`Project`] starts empty: the two may diverge.
+#[derive(Default)]
+struct ResolvedCache(Mutex<BTreeMap<String, Arc<Vec<Node>>>>);
+
+impl ResolvedCache {
+    fn get_or_insert(
+        &self,
+        path: &str,
+        resolve: impl FnOnce() -> TemplateResult<Vec<Node>>,
+    ) -> TemplateResult<Arc<Vec<Node>>> {
+        if let Some(nodes) = self.lock().get(path) {
+            return Ok(Arc::clone(nodes));
+        }
+        let nodes = Arc::new(resolve()?);
+        self.lock().insert(path.to_string(), Arc::clone(&nodes));
+        Ok(nodes)
+    }
+
+    fn clear(&self) {
+        self.lock().clear();
+    }
+
+    fn lock(&self) -> std::sync::MutexGuard<'_, BTreeMap<String, Arc<Vec<Node>>>> {
+        self.0.lock().unwrap_or_else(|e| e.into_inner())
+    }
+}
+
+impl Clone for ResolvedCache {
+    fn clone(&self) -> Self {
+        Self::default()
+    }
+}
+
 impl Default for Project {
     fn default() -> Self {
         Self::new(Config::default())
@@ -3,38 +3,43 @@
 // Unix philosophy: simple, composable security primitives.
 // No frameworks, no magic. Just functions that do one thing.
 
+/// Entity per ASCII byte, built at compile time and indexed directly instead
+/// of matched per character. Bytes from 0x80 up are never escaped.
+type Entities = [Option<&'static str>; 128];
+
+const fn entities(slash: bool) -> Entities {
+    let mut table: Entities = [None; 128];
+    table[b'&' as usize] = Some("&amp;");
+    table[b'<' as usize] = Some("&lt;");
+    table[b'>' as usize] = Some("&gt;");
+    table[b'"' as usize] = Some("&quot;");
+    table[b'\'' as usize] = Some("&#x27;");
+    if slash {
+        table[b'/' as usize] = Some("&#x2F;");
+    }
+    table
+}
+
+const HTML_ENTITIES: Entities = entities(true);
+const ATTR_ENTITIES: Entities = entities(false);
+
+fn escape_by(input: &str, table: &Entities) -> String {
+    let mut out = String::with_capacity(input.len());
+    crate::oxml::escape_with(&mut out, input, |b| {
+        table.get(b as usize).copied().flatten()
+    });
+    out
+}
+
 /// Escape HTML special characters to prevent XSS.
 /// Use this when rendering user-generated content.
 pub fn escape_html(input: &str) -> String {
-    let mut out = String::with_capacity(input.len());
-    for c in input.chars() {
-        match c {
-            '&' => out.push_str("&amp;"),
-            '<' => out.push_str("&lt;"),
-            '>' => out.push_str("&gt;"),
-            '"' => out.push_str("&quot;"),
-            '\'' => out.push_str("&#x27;"),
-            '/' => out.push_str("&#x2F;"),
-            _ => out.push(c),
-        }
-    }
-    out
+    escape_by(input, &HTML_ENTITIES)
 }
 
 /// Escape for use inside HTML attributes.
 pub fn escape_attr(input: &str) -> String {
-    let mut out = String::with_capacity(input.len());
-    for c in input.chars() {
-        match c {
-            '&' => out.push_str("&amp;"),
-            '<' => out.push_str("&lt;"),
-            '>' => out.push_str("&gt;"),
-            '"' => out.push_str("&quot;"),
-            '\'' => out.push_str("&#x27;"),
-            _ => out.push(c),
-        }
-    }
-    out
+    escape_by(input, &ATTR_ENTITIES)
 }
 
 /// Escape for use inside URLs.
@@ -146,6 +151,12 @@ mod tests {
         assert_eq!(escape_html("hello world"), "hello world");
     }
 
+    #[test]
+    fn escape_attr_keeps_slashes_and_multibyte_text() {
+        assert_eq!(escape_html("café </b>"), "café &lt;&#x2F;b&gt;");
+        assert_eq!(escape_attr("café </b>"), "café &lt;/b&gt;");
+    }
+
     #[test]
     fn sanitize_url_safe() {
         assert!(sanitize_url("https://example.com").is_some());
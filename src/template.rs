@@ -359,10 +359,13 @@ use serde_json::Value;
 use std::collections::{BTreeMap, HashMap};
 use std::fs;
 use std::path::PathBuf;
+use std::rc::Rc;
+use std::sync::Arc;
 
 mod ast;
 mod error;
 mod head;
+mod memo;
 mod pipeline;
 mod predicate;
 pub mod resolve;
@@ -388,11 +391,14 @@ pub struct Engine {
     site_description: Option<String>,
     favicon: Option<String>,
     site_url: Option<String>,
-    globals: serde_json::Value,
+    /// Shared with every render's context, so binding `$globals` costs a
+    /// reference count rather than a copy of the table.
+    globals: Arc<Value>,
     default_layout: Option<String>,
     auto_imports: Vec<String>,
     component_paths: Vec<String>,
     tag_registry: crate::features::TagRegistry,
+    parsed: memo::ParseMemo,
 }
 
 impl Engine {
@@ -403,11 +409,12 @@ impl Engine {
             site_description: None,
             favicon: None,
             site_url: None,
-            globals: serde_json::Value::Object(serde_json::Map::new()),
+            globals: Arc::new(Value::Object(serde_json::Map::new())),
             default_layout: None,
             auto_imports: Vec::new(),
             component_paths: vec!["components".to_string()],
             tag_registry: crate::features::TagRegistry::new(),
+            parsed: memo::ParseMemo::default(),
         }
     }
 
@@ -422,11 +429,12 @@ impl Engine {
             site_description: config.site_description.clone(),
             favicon: config.favicon.clone(),
             site_url: config.site_url.clone(),
-            globals: config.globals.clone(),
+            globals: Arc::new(config.globals.clone()),
             default_layout: config.default_layout.clone(),
             auto_imports: config.auto_imports.clone(),
             component_paths: config.component_paths.clone(),
             tag_registry: crate::features::TagRegistry::new(),
+            parsed: memo::ParseMemo::default(),
         }
     }
 
@@ -451,7 +459,7 @@ impl Engine {
     }
 
     pub fn with_globals(mut self, globals: serde_json::Value) -> Self {
-        self.globals = globals;
+        self.globals = Arc::new(globals);
         self
     }
 
@@ -483,19 +491,19 @@ impl Engine {
     }
 
     pub fn render(&self, template_path: &str, data: &Value) -> TemplateResult<String> {
-        let content = self.read_template(template_path)?;
-        self.render_resolved(&content, template_path, data, true)
+        let parsed = self.load_template(template_path)?;
+        self.render_parsed(&parsed, template_path, data, true)
     }
 
     pub fn render_fragment(&self, template_path: &str, data: &Value) -> TemplateResult<String> {
-        let content = self.read_template(template_path)?;
-        self.render_resolved(&content, template_path, data, false)
+        let parsed = self.load_template(template_path)?;
+        self.render_parsed(&parsed, template_path, data, false)
     }
 
     pub fn parse_template(&self, template_path: &str) -> TemplateResult<TemplateAst> {
-        let content = self.read_template(template_path)?;
+        let parsed = self.load_template(template_path)?;
         Ok(TemplateAst {
-            nodes: self.resolve_source(&content, template_path)?,
+            nodes: self.resolve_parsed(&parsed, template_path)?,
         })
     }
 
@@ -548,16 +556,27 @@ impl Engine {
         })
     }
 
-    /// Parse `content` and expand all `<?load?>`s into a fully-resolved tree,
-    /// reading loaded files from disk relative to the base path.
-    fn resolve_source(&self, content: &str, path: &str) -> TemplateResult<Vec<Node>> {
-        let parsed = parse_with_extension(content, path)?;
+    /// Read and parse a template file relative to the base path. The parse is
+    /// memoized (see [`memo`]), so a long-lived engine - the backend runtime's
+    /// across requests, the site generator's across pages - parses a shared
+    /// layout or partial once per edit rather than once per render reaching it.
+    fn load_template(&self, file: &str) -> TemplateResult<Arc<Vec<Node>>> {
+        self.parsed.get_or_parse(
+            &self.base_path.join(file),
+            || self.read_template(file),
+            |text| parse_with_extension(text, file),
+        )
+    }
+
+    /// Expand all `<?load?>`s in a parsed page into a fully-resolved tree,
+    /// loading referenced files from disk relative to the base path.
+    fn resolve_parsed(&self, parsed: &[Node], path: &str) -> TemplateResult<Vec<Node>> {
         let nodes = resolve::with_default_layout(
-            &parsed,
+            parsed,
             self.default_layout.as_deref(),
             &self.auto_imports,
         );
-        let fetch = |file: &str| parse_with_extension(&self.read_template(file)?, file);
+        let fetch = |file: &str| self.load_template(file);
         let mut visited = vec![path.to_string()];
         let resolved = resolve::resolve_loads(&nodes, &fetch, &mut visited, true)?;
 
@@ -573,22 +592,32 @@ impl Engine {
     /// component directories (relative to the base path). Unreadable or
     /// unparseable files are skipped - the library is best-effort discovery,
     /// not a hard dependency of any single page.
+    ///
+    /// Every render walks the whole library, so parses are memoized per file
+    /// (see [`memo`]): an unchanged component is re-read but parsed once.
     fn component_library(&self) -> Vec<Node> {
         let mut defs = Vec::new();
         for dir in &self.component_paths {
             for file in template_files_under(&self.base_path.join(dir)) {
-                if let Ok(text) = fs::read_to_string(&file) {
-                    let rel = file.to_string_lossy();
-                    if let Ok(nodes) = parse_with_extension(&text, &rel) {
-                        resolve::collect_components(&nodes, &mut defs);
-                    }
+                let rel = file.to_string_lossy();
+                let parsed = self.parsed.get_or_parse(
+                    &file,
+                    || {
+                        fs::read_to_string(&file)
+                            .map_err(|e| TemplateError::code(TemplateErrorPhase::Io, e.to_string()))
+                    },
+                    |text| parse_with_extension(text, &rel),
+                );
+                if let Ok(nodes) = parsed {
+                    resolve::collect_components(&nodes, &mut defs);
                 }
             }
         }
         defs
     }
 
-    /// Resolve, render, and (when `wrap`) wrap a bare fragment in an HTML shell.
+    /// Parse, resolve, render, and (when `wrap`) wrap a bare fragment in an
+    /// HTML shell.
     fn render_resolved(
         &self,
         content: &str,
@@ -596,16 +625,29 @@ impl Engine {
         data: &Value,
         wrap: bool,
     ) -> TemplateResult<String> {
-        let nodes = self.resolve_source(content, path)?;
+        let parsed = parse_with_extension(content, path)?;
+        self.render_parsed(&parsed, path, data, wrap)
+    }
+
+    fn render_parsed(
+        &self,
+        parsed: &[Node],
+        path: &str,
+        data: &Value,
+        wrap: bool,
+    ) -> TemplateResult<String> {
+        let nodes = self.resolve_parsed(parsed, path)?;
         let mut context = self.build_context(data);
         self.register_components_from_tree(&nodes, &mut context)?;
         self.collect_styles(&nodes, &mut context);
-        let body_node = self.render_nodes(&nodes, &mut context, path)?;
-        let body = body_node.render();
+        let body = self.render_nodes(&nodes, &mut context, path)?.render();
         if !wrap || is_html_doc(&body) {
             Ok(body)
         } else {
-            Ok(self.wrap_html(body_node))
+            // The body is already rendered (it had to be, to see whether it is
+            // a full document); the shell takes that text as-is rather than
+            // walking the tree a second time.
+            Ok(self.wrap_html(ONode::raw(body)))
         }
     }
 
@@ -671,7 +713,7 @@ impl Engine {
             blocks.push(utilities.join("\n"));
         }
 
-        context.styles = blocks.join("\n\n");
+        context.styles = Rc::from(blocks.join("\n\n"));
     }
 
     fn build_context(&self, data: &Value) -> Context {
@@ -686,7 +728,7 @@ impl Engine {
         if let Some(site_url) = &self.site_url {
             context.set_str("site_url", site_url.clone());
         }
-        context.set_value("globals", self.globals.clone());
+        context.globals = Arc::clone(&self.globals);
         context
     }
 
@@ -723,10 +765,24 @@ impl Engine {
         template_path: &str,
     ) -> TemplateResult<ONode> {
         let mut result = Vec::new();
+        self.render_nodes_into(nodes, context, template_path, &mut result)?;
+        Ok(ONode::cat(result).compact())
+    }
+
+    /// Render `nodes` by appending onto `out`, leaving the `cat`/`compact`
+    /// normalisation to whoever owns the sequence - so loops can pour every
+    /// row into one flat buffer and normalise once.
+    fn render_nodes_into(
+        &self,
+        nodes: &[Node],
+        context: &mut Context,
+        template_path: &str,
+        out: &mut Vec<ONode>,
+    ) -> TemplateResult<()> {
         for node in nodes {
-            result.push(self.render_node(node, context, template_path)?);
+            out.push(self.render_node(node, context, template_path)?);
         }
-        Ok(ONode::cat(result).compact())
+        Ok(())
     }
 
     fn render_node(
@@ -1047,12 +1103,26 @@ impl Engine {
         let Some(Value::Array(items)) = context.get_value(deref(&source)) else {
             return Ok(ONode::empty());
         };
+        self.render_each(items, &item_var, children, context, template_path)
+    }
 
+    /// The shared loop of `<?for?>` and `<?map?>`: render `children` once per
+    /// item with `item_var` bound in a fresh scope. Every row is appended to
+    /// one flat sequence that is normalised once at the end, rather than each
+    /// row building, flattening and compacting a `Cat` of its own.
+    fn render_each(
+        &self,
+        items: Vec<Value>,
+        item_var: &str,
+        children: &[Node],
+        context: &Context,
+        template_path: &str,
+    ) -> TemplateResult<ONode> {
         let mut output = Vec::new();
         for item in items {
             let mut loop_ctx = context.clone();
-            loop_ctx.set_value(&item_var, item);
-            output.push(self.render_nodes(children, &mut loop_ctx, template_path)?);
+            loop_ctx.set_value(item_var, item);
+            self.render_nodes_into(children, &mut loop_ctx, template_path, &mut output)?;
         }
         Ok(ONode::cat(output).compact())
     }
@@ -1092,14 +1162,7 @@ impl Engine {
         let Some(Value::Array(items)) = context.get_value(&source) else {
             return Ok(ONode::empty());
         };
-
-        let mut output = Vec::new();
-        for item in items {
-            let mut loop_ctx = context.clone();
-            loop_ctx.set_value(&item_var, item);
-            output.push(self.render_nodes(children, &mut loop_ctx, template_path)?);
-        }
-        Ok(ONode::cat(output).compact())
+        self.render_each(items, &item_var, children, context, template_path)
     }
 
     /// `<?record as="name"?> <?field name="k" value="v"?> <?/record?>`
@@ -1339,15 +1402,31 @@ impl Engine {
         let over = deref(&attrs.get("over").cloned().unwrap_or_default()).to_string();
         let as_key = attrs.get("as").cloned().unwrap_or_else(|| over.clone());
 
-        if let Some(Value::Array(mut items)) = context.get_value(&over) {
+        // `<?concat?>` is binary: its second operand is resolved first, while
+        // `over` is still in scope, so `with` may name or project into it.
+        let more = match (name, attrs.get("with")) {
+            ("concat", Some(with)) => match context.get_value(deref(with)) {
+                Some(Value::Array(more)) => Some(more),
+                _ => None,
+            },
+            _ => None,
+        };
+
+        // With `as` omitted (or equal to `over`) the pipe is an in-place
+        // rewrite: move the array out of scope, transform it, and bind the
+        // result - one read-modify-write instead of a clone then an overwrite.
+        let current = if as_key == over {
+            context.take_array(&over)
+        } else {
+            match context.get_value(&over) {
+                Some(Value::Array(items)) => Some(items),
+                _ => None,
+            }
+        };
+
+        if let Some(mut items) = current {
             if name == "concat" {
-                // Binary, so it lives here where the second operand can be
-                // resolved against the context: <?concat over="a" with="b"?>.
-                if let Some(with) = attrs.get("with") {
-                    if let Some(Value::Array(more)) = context.get_value(deref(with)) {
-                        items.extend(more);
-                    }
-                }
+                items.extend(more.unwrap_or_default());
                 context.set_value(&as_key, Value::Array(items));
             } else if let Some(out) = pipeline::transform(name, items, attrs) {
                 context.set_value(&as_key, Value::Array(out));
@@ -1487,14 +1566,20 @@ impl Engine {
 
     fn wrap_html(&self, body: ONode) -> String {
         use crate::features::oxml_tags;
+        // The head elements that never vary, pre-rendered exactly as the
+        // builders would emit them (attributes in sorted order) so each page
+        // copies them rather than building and escaping them again.
+        const META: &str = concat!(
+            r#"<meta charset="UTF-8">"#,
+            r#"<meta content="width=device-width, initial-scale=1.0" name="viewport">"#,
+        );
+        const ASSETS: &str = concat!(
+            r#"<link href="/static/css/style.css" rel="stylesheet">"#,
+            r#"<script src="/hrml.js"></script>"#,
+        );
+
         let mut head = vec![
-            ONode::void(oxml_tags::META)
-                .attr("charset", "UTF-8")
-                .build(),
-            ONode::void(oxml_tags::META)
-                .attr("name", "viewport")
-                .attr("content", "width=device-width, initial-scale=1.0")
-                .build(),
+            ONode::raw(META),
             ONode::content(oxml_tags::TITLE)
                 .text(&self.site_name)
                 .build(),
@@ -1518,17 +1603,7 @@ impl Engine {
             );
         }
 
-        head.push(
-            ONode::void(oxml_tags::LINK)
-                .attr("rel", "stylesheet")
-                .attr("href", "/static/css/style.css")
-                .build(),
-        );
-        head.push(
-            ONode::content(oxml_tags::SCRIPT)
-                .attr("src", "/hrml.js")
-                .build(),
-        );
+        head.push(ONode::raw(ASSETS));
 
         crate::features::doc(ONode::cat(head), body)
     }
@@ -1695,56 +1770,22 @@ impl Engine {
         template_path: &str,
     ) -> TemplateResult<String> {
         let full_dir = self.base_path.join(dir);
-        let entries = fs::read_dir(&full_dir).map_err(|e| {
-            TemplateError::code(
-                TemplateErrorPhase::Io,
-                format!("Failed to read directory {}: {}", dir, e),
-            )
-            .with_template_path(template_path)
-            .with_directive("markdownfm")
-        })?;
-
-        let mut filenames: Vec<String> = Vec::new();
-        for entry in entries {
-            let entry = entry.map_err(|e| {
-                TemplateError::code(
-                    TemplateErrorPhase::Io,
-                    format!("Failed to read entry: {}", e),
-                )
+        let files = crate::features::data::scan_stems(&full_dir, &["mdx", "md"]).map_err(|e| {
+            TemplateError::code(TemplateErrorPhase::Io, e)
                 .with_template_path(template_path)
-            })?;
-            let path = entry.path();
-            if !path.is_file() {
-                continue;
-            }
-            let file_name = path.file_name().and_then(|n| n.to_str()).unwrap_or("");
-            if file_name.starts_with('.') || file_name.starts_with('_') {
-                continue;
-            }
-            if let Some(ext) = path.extension() {
-                if ext == "md" || ext == "mdx" {
-                    if let Some(stem) = path.file_stem().and_then(|s| s.to_str()) {
-                        filenames.push(stem.to_string());
-                    }
-                }
-            }
-        }
-        filenames.sort();
+                .with_directive("markdownfm")
+        })?;
 
         let mut posts = Vec::new();
-        for slug in &filenames {
-            for ext in &["mdx", "md"] {
-                let file_path = full_dir.join(format!("{}.{}", slug, ext));
-                if let Ok(content) = fs::read_to_string(&file_path) {
-                    let (meta, _html) = crate::features::render_markdown_with_frontmatter(&content);
-                    let mut obj = match meta {
-                        Value::Object(m) => m,
-                        _ => serde_json::Map::new(),
-                    };
-                    obj.insert("slug".to_string(), Value::String(slug.clone()));
-                    posts.push(Value::Object(obj));
-                    break;
-                }
+        for (slug, file_path) in files {
+            if let Ok(content) = fs::read_to_string(&file_path) {
+                let (meta, _html) = crate::features::render_markdown_with_frontmatter(&content);
+                let mut obj = match meta {
+                    Value::Object(m) => m,
+                    _ => serde_json::Map::new(),
+                };
+                obj.insert("slug".to_string(), Value::String(slug));
+                posts.push(Value::Object(obj));
             }
         }
 
@@ -1779,23 +1820,31 @@ impl Engine {
 
 // --- Context ---
 
+/// A rendering scope. Only `vars` varies between scopes: the data root, the
+/// site globals, the component table and the hoisted CSS are fixed before
+/// rendering starts, so they are shared behind reference counts and the clone
+/// taken for every `<?for?>` row or `<?use?>` copies the bindings alone.
 #[derive(Clone)]
 struct Context {
-    data: Value,
+    data: Rc<Value>,
+    /// Config `[globals]`, bound as `$globals` (behind `Arc`, as the engine
+    /// that owns it is shared across threads). A var of the same name shadows it.
+    globals: Arc<Value>,
     vars: HashMap<String, Value>,
-    components: BTreeMap<String, Vec<Node>>,
+    components: Rc<BTreeMap<String, Vec<Node>>>,
     /// CSS hoisted from `<?style?>` blocks, resolved and de-duplicated, ready to
     /// be emitted once at the `<?styles?>` head sink.
-    styles: String,
+    styles: Rc<str>,
 }
 
 impl Context {
     fn new(data: Value) -> Self {
         Self {
-            data,
+            data: Rc::new(data),
+            globals: Arc::default(),
             vars: HashMap::new(),
-            components: BTreeMap::new(),
-            styles: String::new(),
+            components: Rc::default(),
+            styles: Rc::from(""),
         }
     }
 
@@ -1808,13 +1857,28 @@ impl Context {
     }
 
     fn set_component(&mut self, key: &str, nodes: Vec<Node>) {
-        self.components.insert(key.to_string(), nodes);
+        Rc::make_mut(&mut self.components).insert(key.to_string(), nodes);
     }
 
     fn get_component(&self, key: &str) -> Option<Vec<Node>> {
         self.components.get(key).cloned()
     }
 
+    /// Move an array binding out of scope. A plain var is taken without a
+    /// copy; anything else (a projection into a var or into the data root,
+    /// both of which must stay intact) is cloned exactly as `get_value` would.
+    fn take_array(&mut self, key: &str) -> Option<Vec<Value>> {
+        if let Some(Value::Array(_)) = self.vars.get(key) {
+            if let Some(Value::Array(items)) = self.vars.remove(key) {
+                return Some(items);
+            }
+        }
+        match self.get_value(key) {
+            Some(Value::Array(items)) => Some(items),
+            _ => None,
+        }
+    }
+
     fn get_value(&self, key: &str) -> Option<Value> {
         if let Some(val) = self.vars.get(key) {
             return Some(val.clone());
@@ -1826,6 +1890,12 @@ impl Context {
             if let Some(seed) = self.vars.get(first) {
                 return project(seed, rest).cloned();
             }
+            if first == "globals" {
+                return project(&self.globals, rest).cloned();
+            }
+        }
+        if key == "globals" {
+            return Some(Value::clone(&self.globals));
         }
 
         project(&self.data, key).cloned()
@@ -0,0 +1,110 @@
+//! A memo table for parsed template files - Michie's *memo functions* (1968)
+//! applied to `parse`.
+//!
+//! Parsing is a pure function of a file's text, so the table is validated by
+//! that text itself: each entry keeps the source it was parsed from, and a
+//! lookup reads the file and compares. A read is one syscall and a memcmp;
+//! the parse is the cost worth skipping. Metadata stamps are deliberately not
+//! trusted - a same-size edit inside a coarse mtime tick, or a copy that
+//! preserves mtimes (`tar`, `rsync -t`, `cp -p`), would otherwise pin a stale
+//! parse for as long as the engine lives. Invalidation is therefore implicit
+//! and exact: there is no "clear" to forget after an edit, and clones of an
+//! [`Engine`] can share one table.
+//!
+//! Retention: an entry holds a file's source and its parse, and lives only as
+//! long as the file does. A failed read drops the entry for that path, and
+//! every miss - which is to say every edit - sweeps out entries whose file
+//! has since been deleted or renamed. A long-lived engine therefore holds at
+//! most the files it has seen that still exist, plus any deleted since the
+//! last edit.
+//!
+//! [`Engine`]: super::Engine
+
+use super::{Node, TemplateResult};
+use std::collections::HashMap;
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex, MutexGuard};
+
+#[derive(Clone, Default)]
+pub(super) struct ParseMemo {
+    table: Arc<Mutex<HashMap<PathBuf, (String, Arc<Vec<Node>>)>>>,
+}
+
+impl ParseMemo {
+    /// The parsed nodes of `path`, reusing the memoized parse when the text
+    /// `read` returns is the text it was taken from. `parse` runs on a miss.
+    /// Read and parse failures are returned and never memoized; a failed read
+    /// also forgets any parse held for `path`.
+    pub(super) fn get_or_parse(
+        &self,
+        path: &Path,
+        read: impl FnOnce() -> TemplateResult<String>,
+        parse: impl FnOnce(&str) -> TemplateResult<Vec<Node>>,
+    ) -> TemplateResult<Arc<Vec<Node>>> {
+        let text = match read() {
+            Ok(text) => text,
+            Err(e) => {
+                self.lock().remove(path);
+                return Err(e);
+            }
+        };
+
+        if let Some((held, nodes)) = self.lock().get(path) {
+            if *held == text {
+                return Ok(Arc::clone(nodes));
+            }
+        }
+
+        let nodes = Arc::new(parse(&text)?);
+        let mut table = self.lock();
+        table.retain(|held, _| held.is_file());
+        table.insert(path.to_path_buf(), (text, Arc::clone(&nodes)));
+        Ok(nodes)
+    }
+
+    fn lock(&self) -> MutexGuard<'_, HashMap<PathBuf, (String, Arc<Vec<Node>>)>> {
+        self.table.lock().unwrap_or_else(|e| e.into_inner())
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::template::{TemplateError, TemplateErrorPhase};
+    use std::fs;
+
+    fn load(memo: &ParseMemo, path: &Path) -> TemplateResult<Arc<Vec<Node>>> {
+        memo.get_or_parse(
+            path,
+            || {
+                fs::read_to_string(path)
+                    .map_err(|e| TemplateError::code(TemplateErrorPhase::Io, e.to_string()))
+            },
+            |_| Ok(Vec::new()),
+        )
+    }
+
+    #[test]
+    fn entries_do_not_outlive_their_files() {
+        let dir = tempfile::tempdir().unwrap();
+        let (a, b) = (dir.path().join("a.hrml"), dir.path().join("b.hrml"));
+        fs::write(&a, "a").unwrap();
+        fs::write(&b, "b").unwrap();
+
+        let memo = ParseMemo::default();
+        load(&memo, &a).unwrap();
+        load(&memo, &b).unwrap();
+        assert_eq!(memo.lock().len(), 2);
+
+        // A failed read forgets the path it was for.
+        fs::remove_file(&a).unwrap();
+        assert!(load(&memo, &a).is_err());
+        assert_eq!(memo.lock().len(), 1);
+
+        // A miss sweeps out files deleted without being read again.
+        fs::remove_file(&b).unwrap();
+        fs::write(&a, "a again").unwrap();
+        load(&memo, &a).unwrap();
+        assert!(memo.lock().keys().eq([&a]));
+    }
+}
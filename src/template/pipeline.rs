@@ -14,6 +14,7 @@
 
 use super::{predicate, project, truthy_str};
 use serde_json::{json, Value};
+use std::cmp::Reverse;
 use std::collections::{BTreeMap, BTreeSet};
 
 /// Apply the named list transform, or `None` if `name` is not a pipeline op.
@@ -47,17 +48,18 @@ fn filter(items: Vec<Value>, attrs: &BTreeMap<String, String>) -> Vec<Value> {
 }
 
 /// Stably order items by a (dotted) field path; `order="desc"` reverses.
+///
+/// Keys are projected once per item rather than twice per comparison - the
+/// decorate-sort-undecorate (Schwartzian) transform - so a sort over `n`
+/// items allocates `n` keys, not `O(n log n)`.
 fn sort(mut items: Vec<Value>, attrs: &BTreeMap<String, String>) -> Vec<Value> {
     let by = attrs.get("by").cloned().unwrap_or_default();
-    let desc = attrs.get("order").is_some_and(|o| o == "desc");
-    items.sort_by(|a, b| {
-        let (ka, kb) = (sort_key(project(a, &by)), sort_key(project(b, &by)));
-        if desc {
-            kb.cmp(&ka)
-        } else {
-            ka.cmp(&kb)
-        }
-    });
+    let key = |item: &Value| sort_key(project(item, &by));
+    if attrs.get("order").is_some_and(|o| o == "desc") {
+        items.sort_by_cached_key(|item| Reverse(key(item)));
+    } else {
+        items.sort_by_cached_key(key);
+    }
     items
 }
 
@@ -233,6 +235,25 @@ mod tests {
         assert_eq!(kept.len(), 1);
     }
 
+    #[test]
+    fn sort_is_stable_in_both_directions() {
+        let items = vec![
+            json!({ "k": 1, "tag": "a" }),
+            json!({ "k": 2, "tag": "b" }),
+            json!({ "k": 1, "tag": "c" }),
+            json!({ "k": 2, "tag": "d" }),
+        ];
+        let tags = |xs: Vec<Value>| -> Vec<String> {
+            xs.iter()
+                .map(|x| x["tag"].as_str().unwrap().to_string())
+                .collect()
+        };
+        let asc = sort(items.clone(), &attrs(&[("by", "k")]));
+        assert_eq!(tags(asc), ["a", "c", "b", "d"]);
+        let desc = sort(items, &attrs(&[("by", "k"), ("order", "desc")]));
+        assert_eq!(tags(desc), ["b", "d", "a", "c"]);
+    }
+
     #[test]
     fn slice_to_is_an_end_index_and_count_a_length() {
         let items: Vec<Value> = (0..6).map(|n| json!(n)).collect();
@@ -23,6 +23,7 @@
 use super::ast::Node;
 use super::error::{TemplateError, TemplateErrorPhase, TemplateResult};
 use std::collections::BTreeMap;
+use std::sync::Arc;
 
 /// Pure data-pipeline directives (Kleisli steps over the context): they set a
 /// context variable and emit nothing. These are the only directives hoisted
@@ -33,10 +34,11 @@ const PREAMBLE_DIRECTIVES: &[&str] = &["data", "sort", "filter", "slice"];
 
 /// A source of parsed template nodes, keyed by file path.
 ///
-/// Disk-backed engines read and parse the file; in-memory projects look it up
-/// in their file map. Cycle detection is the resolver's concern, not the
-/// fetcher's.
-pub type Fetch<'a> = dyn Fn(&str) -> TemplateResult<Vec<Node>> + 'a;
+/// Disk-backed engines hand out their memoized parse; in-memory projects look
+/// it up in their file map. The resolver only reads the loaded tree, so it is
+/// shared rather than owned. Cycle detection is the resolver's concern, not
+/// the fetcher's.
+pub type Fetch<'a> = dyn Fn(&str) -> TemplateResult<Arc<Vec<Node>>> + 'a;
 
 /// Wrap a page in the configured default layout when it declares no `<?load?>`
 /// of its own. A page then needs only its `<?block?>` fills (and any preamble
@@ -83,3 +83,18 @@ fn endpoint_rejects_non_api_paths() {
     let err = rt.call_endpoint("/pages/home", &json!({})).unwrap_err();
     assert!(err.contains("Invalid endpoint path"));
 }
+
+#[test]
+fn endpoint_template_shadows_text_which_shadows_json() {
+    let dir = setup_backend_dir("precedence");
+    fs::write(format!("{}/api/todos.json", dir), "{\"ok\":true}").unwrap();
+    fs::write(format!("{}/api/todos.txt", dir), "plain").unwrap();
+
+    let rt = Runtime::new(&dir);
+    let value = rt.call_endpoint("/api/todos", &json!({})).unwrap();
+    assert_eq!(value.as_str().unwrap(), "plain");
+
+    fs::write(format!("{}/api/todos.hrml", dir), "<i>tmpl</i>").unwrap();
+    let value = rt.call_endpoint("/api/todos", &json!({})).unwrap();
+    assert_eq!(value.as_str().unwrap(), "<i>tmpl</i>");
+}
@@ -57,3 +57,54 @@ fn test_component_loaded_from_file() {
         "Loaded component should work with bindings"
     );
 }
+
+#[test]
+fn test_component_library_sees_edits_between_renders() {
+    let test_dir = setup_test_templates("component_library_edit");
+    let component = format!("{}/components/badge.hrml", test_dir);
+    fs::write(
+        &component,
+        r#"<?component id="badge"?><b>old</b><?/component?>"#,
+    )
+    .unwrap();
+    fs::write(
+        format!("{}/pages/badge.hrml", test_dir),
+        r#"<?use id="badge"?>"#,
+    )
+    .unwrap();
+
+    let engine = Engine::new(&test_dir);
+    let first = engine
+        .render_fragment("pages/badge.hrml", &json!({}))
+        .unwrap();
+    assert!(first.contains("<b>old</b>"));
+
+    fs::write(
+        &component,
+        r#"<?component id="badge"?><b>edited</b><?/component?>"#,
+    )
+    .unwrap();
+    let second = engine
+        .render_fragment("pages/badge.hrml", &json!({}))
+        .unwrap();
+    assert!(second.contains("<b>edited</b>"));
+
+    // A same-length edit that keeps the old mtime, as a coarse-grained
+    // filesystem or `cp -p` would, must still be picked up.
+    let mtime = fs::metadata(&component).unwrap().modified().unwrap();
+    fs::write(
+        &component,
+        r#"<?component id="badge"?><b>tweaks</b><?/component?>"#,
+    )
+    .unwrap();
+    fs::File::options()
+        .write(true)
+        .open(&component)
+        .unwrap()
+        .set_modified(mtime)
+        .unwrap();
+    let third = engine
+        .render_fragment("pages/badge.hrml", &json!({}))
+        .unwrap();
+    assert!(third.contains("<b>tweaks</b>"));
+}
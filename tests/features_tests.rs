@@ -1,4 +1,6 @@
-use xrml::features::{excerpt, render_latex_block, render_latex_inline, render_markdown, slugify};
+use xrml::features::{
+    excerpt, load_data_dir, render_latex_block, render_latex_inline, render_markdown, slugify,
+};
 
 #[test]
 fn test_markdown_renders_headings_and_lists() {
@@ -24,3 +26,20 @@ fn test_text_helpers_slugify_and_excerpt() {
     assert_eq!(slugify("Hello, HRML Framework!"), "hello-hrml-framework");
     assert_eq!(excerpt("one two three four", 9), "one two...");
 }
+
+#[test]
+fn test_data_dir_loads_one_record_per_stem_by_preference() {
+    let dir = tempfile::tempdir().unwrap();
+    std::fs::write(dir.path().join("b.json"), r#"{"from": "json"}"#).unwrap();
+    std::fs::write(dir.path().join("b.toml"), "from = \"toml\"").unwrap();
+    std::fs::write(dir.path().join("a.toml"), "from = \"toml\"").unwrap();
+    std::fs::write(dir.path().join("_draft.json"), "{}").unwrap();
+    std::fs::write(dir.path().join("notes.txt"), "skip").unwrap();
+
+    let items = load_data_dir(dir.path()).unwrap();
+    let items = items.as_array().unwrap();
+    assert_eq!(items.len(), 2);
+    assert_eq!(items[0]["slug"], "a");
+    assert_eq!(items[1]["slug"], "b");
+    assert_eq!(items[1]["from"], "json");
+}
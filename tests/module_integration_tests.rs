@@ -1,4 +1,5 @@
 use xrml::config::Config;
+use xrml::project::Project;
 use xrml::router::Router;
 use xrml::ssg::SSG;
 use xrml::template::Engine;
@@ -95,3 +96,38 @@ fn ssg_build_generates_files_and_sitemap() {
     assert!(report.pages.len() >= 2);
     assert!(out.join("sitemap.xml").exists());
 }
+
+#[test]
+fn project_renders_see_every_kind_of_edit() {
+    let page = |project: &Project| {
+        project
+            .render_fragment("pages/index.hrml", &json!({}))
+            .unwrap()
+    };
+
+    let mut project = Project::default();
+    let load = r#"<?load file="parts/a.hrml"?>"#;
+    project.add_file("pages/index.hrml".into(), load.into());
+    project.add_file("parts/a.hrml".into(), "<p>one</p>".into());
+    project.parse_all().unwrap();
+    assert!(page(&project).contains("one"));
+
+    // A dependency edited through update_file.
+    let edit = "<p>two</p>".to_string();
+    project.update_file("parts/a.hrml", edit).unwrap();
+    assert!(page(&project).contains("two"));
+
+    // A dependency edited in place through get_file_mut.
+    let file = project.get_file_mut("parts/a.hrml").unwrap();
+    file.text = "<p>three</p>".into();
+    file.tree = None;
+    file.parse().unwrap();
+    assert!(page(&project).contains("three"));
+
+    // A clone diverges from the original without sharing resolved pages.
+    let mut copy = project.clone();
+    let edit = "<p>four</p>".to_string();
+    copy.update_file("parts/a.hrml", edit).unwrap();
+    assert!(page(&copy).contains("four"));
+    assert!(page(&project).contains("three"));
+}
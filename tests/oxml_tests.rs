@@ -229,3 +229,15 @@ fn test_oxml_attr_if_conditional() {
     assert!(node.contains("defer"));
     assert!(!node.contains("async"));
 }
+
+#[test]
+fn test_oxml_escapes_text_and_attrs() {
+    let node = ONode::content(oxml_tags::P)
+        .attr("title", "Tom & \"Jerry\" <3")
+        .text("<b>café & 'crème'</b>")
+        .build();
+    assert_eq!(
+        node.render(),
+        "<p title=\"Tom &amp; &quot;Jerry&quot; <3\">&lt;b&gt;café &amp; &#39;crème&#39;&lt;/b&gt;</p>"
+    );
+}
@@ -580,6 +580,87 @@ fn test_render_fragment_does_not_wrap_html_document() {
     assert_eq!(result.trim(), "<section><h1>Fragment</h1></section>");
     assert!(!result.contains("<!DOCTYPE html>"));
 }
+
+#[test]
+fn test_pipeline_rewrites_in_place_and_leaves_sources_intact() {
+    let test_dir = setup_test_templates("pipeline_in_place");
+    fs::write(
+        format!("{}/pages/pipeline.hrml", test_dir),
+        r#"<?sort over="posts" by="n" order="desc" as="desc"?>
+<?sort over="posts" by="n"?>
+<?slice over="posts" count="2"?>
+<p><?map over="posts" as="p"?>$p.n<?/map?></p>
+<p><?map over="desc" as="p"?>$p.n<?/map?></p>
+<p><?map over="data.posts" as="p"?>$p.n<?/map?></p>
+<?concat over="posts" with="posts"?>
+<p>self:<?map over="posts" as="p"?>$p.n<?/map?></p>"#,
+    )
+    .unwrap();
+
+    let engine = Engine::new(&test_dir);
+    let result = engine
+        .render_fragment(
+            "pages/pipeline.hrml",
+            &json!({
+                "posts": [{"n": 2}, {"n": 1}, {"n": 3}],
+                "data": {"posts": [{"n": 2}, {"n": 1}, {"n": 3}]}
+            }),
+        )
+        .unwrap();
+
+    assert!(result.contains("<p>12</p>"));
+    assert!(result.contains("<p>321</p>"));
+    assert!(result.contains("<p>213</p>"));
+    // `with` reads the var `over` binds, not the data root of the same name.
+    assert!(result.contains("<p>self:1212</p>"));
+}
+
+#[test]
+fn test_attribute_values_cannot_break_out_of_their_quotes() {
+    let test_dir = setup_test_templates("attr_quote");
+    fs::write(
+        format!("{}/pages/attr.hrml", test_dir),
+        r#"<input value="$title" title="Fish &amp; Chips">"#,
+    )
+    .unwrap();
+
+    let engine = Engine::new(&test_dir);
+    let result = engine
+        .render_fragment(
+            "pages/attr.hrml",
+            &json!({"title": "\" onfocus=\"alert(1)"}),
+        )
+        .unwrap();
+
+    assert!(result.contains(r#"value="&quot; onfocus=&quot;alert(1)""#));
+    assert!(result.contains(r#"title="Fish &amp; Chips""#));
+}
+
+#[test]
+fn test_engine_sees_edited_loads_between_renders() {
+    let test_dir = setup_test_templates("edited_loads");
+    fs::write(format!("{}/layouts/part.hrml", test_dir), "<p>first</p>").unwrap();
+    fs::write(
+        format!("{}/pages/host.hrml", test_dir),
+        r#"<?load file="layouts/part.hrml"?>"#,
+    )
+    .unwrap();
+
+    let engine = Engine::new(&test_dir);
+    let before = engine
+        .render_fragment("pages/host.hrml", &json!({}))
+        .unwrap();
+    assert!(before.contains("<p>first</p>"));
+
+    // Same length as before: only the contents tell the two apart.
+    fs::write(format!("{}/layouts/part.hrml", test_dir), "<p>again</p>").unwrap();
+    let after = engine
+        .render_fragment("pages/host.hrml", &json!({}))
+        .unwrap();
+    assert!(after.contains("<p>again</p>"));
+    assert!(!after.contains("first"));
+}
+
 #[test]
 fn test_debug() {
     use xrml::{template::Engine};